@@ -1,10 +1,31 @@
 import streamlit as st
-import json
+import orjson
+import atexit
+import copy
+import errno
+import hashlib
+import logging
 import os
-from typing import Dict, Optional, Tuple
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+T = TypeVar("T")
 
 # VARIABLES
 WEEK_NUMBER = 2
@@ -12,72 +33,160 @@ STATIC_TIME = "7-8:30pm"
 
 # Configuration
 DATA_FILE = "signup_data.json"
+DATA_CACHE_TTL_SECONDS = 30
+DEBUG_PRETTY_JSON = os.getenv("DEBUG_PRETTY_JSON", "false").lower() == "true"
 MAX_PLAYERS_PER_TYPE = 10
+MAX_MESSAGES_PER_CONNECTION = 100  # reconnect to SMTP after this many messages on one connection
 DATES = ["Tuesday November 18", "Tuesday November 25", "Tuesday December 2", "Tuesday December 9", "Tuesday December 16", "Tuesday December 23"]
 STATIC_WEEK = f"week_{WEEK_NUMBER}"
 STATIC_DATE = DATES[1]
+SESSION_DISPLAY = f"{STATIC_DATE}, {STATIC_TIME}"
+PROMOTION_SUBJECT = f"Winter Hoopla - You have a spot for {STATIC_DATE} {STATIC_TIME}"
+PROMOTION_BODY = (
+    "Hi {name},\n\n"
+    "This is an automated email. You've been promoted from the waitlist and are now signed up "
+    "to attend indoor goaltimate at ComEd Rec Center.\n\n"
+    "Session Details:\n"
+    f"Date/Time: {SESSION_DISPLAY}\n"
+    "Location: ComEd Rec Center\n\n"
+    "If you can no longer attend, please remove your signup so that the next player on the waitlist can be promoted.\n"
+    "You can manage your signup at: https://winter-hoopla.streamlit.app/\n\n"
+    "See you on the field!\n\n"
+    "- Annie"
+)
 TABLE_NAME = "app_data"
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+SCHEMA_VERSION = 2  # bump when _normalize_data_structure() learns a new migration
+SUPABASE_TIMEOUT_SECONDS = 5
 
-# Supabase configuration
-SUPABASE_CONFIG = {
-    "url": os.getenv("SUPABASE_URL", ""),
-    "key": os.getenv("SUPABASE_KEY", ""),
-    "enabled": os.getenv("SUPABASE_ENABLED", "false").lower() == "true"
-}
+@st.cache_data(show_spinner=False)
+def get_supabase_config() -> Dict:
+    """
+    Resolve Supabase configuration on first use (Streamlit secrets override environment variables).
+    Cached so secrets are read once per process rather than on every rerun.
+    """
+    config = {
+        "url": os.getenv("SUPABASE_URL", ""),
+        "key": os.getenv("SUPABASE_KEY", ""),
+        "enabled": os.getenv("SUPABASE_ENABLED", "false").lower() == "true"
+    }
+    
+    # Try to get Supabase config from Streamlit secrets
+    try:
+        if "supabase" in st.secrets:
+            config.update({
+                "url": st.secrets.supabase.get("url", config["url"]),
+                "key": st.secrets.supabase.get("key", config["key"]),
+                "enabled": st.secrets.supabase.get("enabled", config["enabled"])
+            })
+    except:
+        pass
+    return config
+
+
+@st.cache_data(show_spinner=False)
+def get_email_config() -> Dict:
+    """
+    Resolve email configuration on first use (Streamlit secrets override environment variables).
+    Cached so secrets are read once per process rather than on every rerun.
+    """
+    config = {
+        "smtp_server": os.getenv("SMTP_SERVER", "smtp.gmail.com"),
+        "smtp_port": int(os.getenv("SMTP_PORT", "587")),
+        "sender_email": os.getenv("SENDER_EMAIL", ""),
+        "sender_password": os.getenv("SENDER_PASSWORD", ""),
+        "enabled": os.getenv("EMAIL_ENABLED", "false").lower() == "true"
+    }
+    
+    # Try to get email config from Streamlit secrets
+    try:
+        if "email" in st.secrets:
+            config.update({
+                "smtp_server": st.secrets.email.get("smtp_server", config["smtp_server"]),
+                "smtp_port": st.secrets.email.get("smtp_port", config["smtp_port"]),
+                "sender_email": st.secrets.email.get("sender_email", config["sender_email"]),
+                "sender_password": st.secrets.email.get("sender_password", config["sender_password"]),
+                "enabled": st.secrets.email.get("enabled", config["enabled"])
+            })
+    except:
+        pass
+    config["active"] = bool(config["enabled"] and config["sender_email"])
+    return config
+
+
+@st.cache_resource(show_spinner=False)
+def get_supabase_client(url: str, key: str):
+    """
+    Create the Supabase client once per process. Streamlit re-executes this script on every
+    rerun, so caching the client keeps its pooled keep-alive connections instead of paying
+    a fresh TCP + TLS handshake on each interaction.
+    """
+    from supabase import create_client, ClientOptions
+    return create_client(url, key, options=ClientOptions(postgrest_client_timeout=SUPABASE_TIMEOUT_SECONDS))
 
-# Try to get Supabase config from Streamlit secrets
-try:
-    if "supabase" in st.secrets:
-        SUPABASE_CONFIG.update({
-            "url": st.secrets.supabase.get("url", SUPABASE_CONFIG["url"]),
-            "key": st.secrets.supabase.get("key", SUPABASE_CONFIG["key"]),
-            "enabled": st.secrets.supabase.get("enabled", SUPABASE_CONFIG["enabled"])
-        })
-except:
-    pass
-
-# Initialize Supabase client if configured
-supabase_client = None
-if SUPABASE_CONFIG["enabled"] and SUPABASE_CONFIG["url"] and SUPABASE_CONFIG["key"]:
+
+def _with_retry(request: Callable[[], T], attempts: int = 2, base_delay: float = 0.1) -> T:
+    """
+    Run a Supabase request, retrying transient network errors and gateway 5xx responses with
+    exponential backoff. Auth, 4xx and PostgREST errors are raised immediately.
+    """
+    # Imported lazily, like supabase itself, so a missing install still falls back to the local file
+    import httpx
+    from postgrest.exceptions import APIError
+    for attempt in range(attempts):
+        try:
+            return request()
+        except (httpx.TransportError, APIError) as e:
+            # postgrest raises APIError for every non-2xx; only a non-JSON (gateway) response
+            # carries the numeric HTTP status in .code, PostgREST's own errors use PGRSTxxx codes
+            code = str(getattr(e, "code", ""))
+            transient = isinstance(e, httpx.TransportError) or (code.isdigit() and int(code) >= 500)
+            if not transient or attempt == attempts - 1:
+                raise
+            time.sleep(base_delay * 2 ** attempt)
+
+
+def _get_client():
+    """Return the Supabase client if configured, or None to use local file storage."""
+    config = get_supabase_config()
+    if not (config["enabled"] and config["url"] and config["key"]):
+        return None
     try:
-        from supabase import create_client, Client
-        supabase_client: Optional[Client] = create_client(SUPABASE_CONFIG["url"], SUPABASE_CONFIG["key"])
+        return get_supabase_client(config["url"], config["key"])
     except Exception as e:
         st.warning(f"⚠️ Supabase connection failed: {str(e)}. Falling back to local file storage.")
-        supabase_client = None
-else:
-    supabase_client = None
-
-# Email configuration (set via environment variables or Streamlit secrets)
-EMAIL_CONFIG = {
-    "smtp_server": os.getenv("SMTP_SERVER", "smtp.gmail.com"),
-    "smtp_port": int(os.getenv("SMTP_PORT", "587")),
-    "sender_email": os.getenv("SENDER_EMAIL", ""),
-    "sender_password": os.getenv("SENDER_PASSWORD", ""),
-    "enabled": os.getenv("EMAIL_ENABLED", "false").lower() == "true"
-}
-
-# Try to get email config from Streamlit secrets
-try:
-    if "email" in st.secrets:
-        EMAIL_CONFIG.update({
-            "smtp_server": st.secrets.email.get("smtp_server", EMAIL_CONFIG["smtp_server"]),
-            "smtp_port": st.secrets.email.get("smtp_port", EMAIL_CONFIG["smtp_port"]),
-            "sender_email": st.secrets.email.get("sender_email", EMAIL_CONFIG["sender_email"]),
-            "sender_password": st.secrets.email.get("sender_password", EMAIL_CONFIG["sender_password"]),
-            "enabled": st.secrets.email.get("enabled", EMAIL_CONFIG["enabled"])
-        })
-except:
-    pass
-
-
-def load_data() -> Dict:
-    """Load signup data from Supabase or JSON file."""
+        return None
+
+
+@st.cache_data(ttl=DATA_CACHE_TTL_SECONDS, show_spinner=False)
+def load_data(data_version: Optional[float]) -> Dict:
+    """
+    Load signup data for rendering, cached briefly so reruns skip the Supabase round-trip.
+    Keyed on _data_version() so edits to the local file are picked up at once, and
+    save_data() clears the cache, so writes from this app are visible immediately.
+    The fetch time is kept in "_loaded_at" so sessions can age the data from when it was read.
+    """
+    data = _load_data_uncached()
+    data["_loaded_at"] = time.monotonic()
+    return data
+
+
+def _load_data_uncached(use_file_cache: bool = True) -> Dict:
+    """Load signup data from Supabase or JSON file, with in-memory lookup indexes attached."""
+    return _build_indexes(_read_data(use_file_cache))
+
+
+def _read_data(use_file_cache: bool = True) -> Dict:
+    """
+    Read signup data from Supabase or JSON file. Pass use_file_cache=False to bypass the
+    mtime-keyed file cache (mtime granularity can miss a write made in the same tick).
+    """
     # Try Supabase first if enabled
+    supabase_client = _get_client()
     if supabase_client:
         try:
             # Fetch data from Supabase
-            response = supabase_client.table(TABLE_NAME).select("*").eq("id", "main").execute()
+            response = _with_retry(lambda: supabase_client.table(TABLE_NAME).select("*").eq("id", "main").execute())
             
             if response.data and len(response.data) > 0:
                 existing_data = response.data[0]["data"]
@@ -89,6 +198,7 @@ def load_data() -> Dict:
             else:
                 # Initialize empty data structure
                 data = {
+                    "schema_version": SCHEMA_VERSION,
                     "players": {},
                     "signups": {"mmp": [], "wmp": [], "no_preference": []},
                     "waitlists": {"mmp": [], "wmp": [], "no_preference": []}
@@ -98,26 +208,89 @@ def load_data() -> Dict:
                 return data
             
             # Ensure structure is correct (migrate if needed)
-            data = _normalize_data_structure(data)
-            return data
+            return _ensure_schema(data)
         except Exception as e:
             st.warning(f"⚠️ Failed to load from Supabase: {str(e)}. Falling back to local file.")
     
     # Fallback to JSON file
+    return _load_file_data(_data_file_mtime()) if use_file_cache else _read_file_data()
+
+
+def _build_indexes(data: Dict) -> Dict:
+    """
+    Attach in-memory indexes for O(1) membership (and waitlist position) checks and hold waitlists as deques
+    so promotion pops from the front in O(1).
+    Keys starting with an underscore are never persisted (see _serializable()).
+    """
+    data["_signup_idx"] = {key: set(ids) for key, ids in data["signups"].items()}
+    data["waitlists"] = {key: deque(ids) for key, ids in data["waitlists"].items()}
+    data["_waitlist_idx"] = {key: _index_waitlist(ids) for key, ids in data["waitlists"].items()}
+    return data
+
+
+def _index_waitlist(waitlist) -> Dict[str, int]:
+    """Map each waitlisted player id to their 1-based position."""
+    return {pid: position for position, pid in enumerate(waitlist, 1)}
+
+
+def _serializable(data: Dict) -> Dict:
+    """Return a JSON-ready copy of data without the in-memory indexes."""
+    document = {key: value for key, value in data.items() if not key.startswith("_")}
+    document["waitlists"] = {key: list(ids) for key, ids in data["waitlists"].items()}
+    return document
+
+
+def _data_version() -> Optional[float]:
+    """
+    Return a version stamp for the stored data: the local file's mtime, or None when
+    Supabase is the source of truth (no cheap way to tell whether it changed).
+    """
+    return None if _get_client() else _data_file_mtime()
+
+
+def _data_file_mtime() -> float:
+    """Return the modification time of the local data file, or 0 if it is missing."""
+    return os.path.getmtime(DATA_FILE) if os.path.exists(DATA_FILE) else 0
+
+
+@st.cache_data(show_spinner=False)
+def _load_file_data(mtime: float) -> Dict:
+    """
+    Load and normalize the local JSON file.
+    Cached per file modification time so unchanged files are not re-parsed on every rerun.
+    """
+    return _read_file_data()
+
+
+def _read_file_data() -> Dict:
+    """Read and normalize the local JSON file, or return an empty structure if it is missing."""
     if os.path.exists(DATA_FILE):
-        with open(DATA_FILE, "r") as f:
-            data = json.load(f)
-        data = _normalize_data_structure(data)
-        return data
+        with open(DATA_FILE, "rb") as f:
+            data = orjson.loads(f.read())
+        return _ensure_schema(data)
     
     # Return empty structure
     return {
+        "schema_version": SCHEMA_VERSION,
         "players": {},
         "signups": {"mmp": [], "wmp": [], "no_preference": []},
         "waitlists": {"mmp": [], "wmp": [], "no_preference": []}
     }
 
 
+def _ensure_schema(data: Dict) -> Dict:
+    """
+    Normalize data saved by an older schema and stamp it with SCHEMA_VERSION.
+    Data already at the current version is returned untouched. The stamp is persisted
+    with the next save rather than written back here, so loading never races a writer.
+    """
+    if data.get("schema_version") == SCHEMA_VERSION:
+        return data
+    data = _normalize_data_structure(data)
+    data["schema_version"] = SCHEMA_VERSION
+    return data
+
+
 def _normalize_data_structure(data: Dict) -> Dict:
     """Normalize data structure to ensure it has the correct format."""
     # Migrate old week-based structure to flat structure
@@ -167,224 +340,470 @@ def _normalize_data_structure(data: Dict) -> Dict:
     return data
 
 
-def save_data(data: Dict):
-    """Save signup data to Supabase or JSON file."""
+def save_data(data: Dict) -> Dict:
+    """Save signup data to Supabase or JSON file and return the saved data (with indexes)."""
+    document = _serializable(data)
     # Try Supabase first if enabled
+    supabase_client = _get_client()
     if supabase_client:
         try:
-            # Load existing data from Supabase
-            response = supabase_client.table(TABLE_NAME).select("*").eq("id", "main").execute()
-            if response.data and len(response.data) > 0:
-                existing_data = response.data[0]["data"]
-            else:
-                existing_data = {}
-
-            # Update only the current week
-            existing_data[STATIC_WEEK] = data
-
-            # Upsert the updated data back to Supabase
-            supabase_client.table(TABLE_NAME).upsert({
-                "id": "main",
-                "data": existing_data
-            }).execute()
-            return
+            # Patch only the current week; update_week returns the stored week (see SUPABASE_SETUP.md),
+            # so callers can reuse it instead of reloading
+            saved = _save_week(supabase_client, document)
+            load_data.clear()
+            if isinstance(saved, dict):
+                return _build_indexes(_ensure_schema(saved))
+            return data
         except Exception as e:
             st.warning(f"⚠️ Failed to save to Supabase: {str(e)}. Falling back to local file.")
     
-    # Fallback to JSON file
-    with open(DATA_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    # Fallback to JSON file (write to a temp file and swap it in so a crash never truncates the data)
+    payload = orjson.dumps(document, option=orjson.OPT_INDENT_2 if DEBUG_PRETTY_JSON else 0)
+    
+    # Skip the write if this exact payload is what we last wrote and nobody has touched the file since
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+    last_write = _last_file_write()
+    if last_write.get("digest") == digest and last_write.get("mtime") == _data_file_mtime():
+        return data
+    
+    tmp_file = DATA_FILE + ".tmp"
+    with open(tmp_file, "wb", buffering=262144) as f:
+        f.write(payload)
+    os.replace(tmp_file, DATA_FILE)
+    last_write.update(digest=digest, mtime=_data_file_mtime())
+    _load_file_data.clear()
+    load_data.clear()
+    return data
+
+
+def _save_week(supabase_client, document: Dict):
+    """
+    Save the current week through the update_week RPC and return what it stored. Once the
+    function is found missing, this process saves with _save_week_by_upsert() instead.
+    """
+    from postgrest.exceptions import APIError
+    status = _update_week_status()
+    if not status.get("missing"):
+        try:
+            return _with_retry(lambda: supabase_client.rpc("update_week", {"week": STATIC_WEEK, "payload": document}).execute()).data
+        except APIError as e:
+            if e.code != "PGRST202":
+                raise
+            # update_week hasn't been created in this database yet; keep saving to Supabase the old way
+            status["missing"] = True
+            logger.warning(
+                "Supabase function update_week not found; saving the whole app_data row instead. "
+                "Run the update_week SQL from SUPABASE_SETUP.md to save in a single request."
+            )
+    return _save_week_by_upsert(supabase_client, document)
+
+
+def _save_week_by_upsert(supabase_client, document: Dict) -> Dict:
+    """Save the current week by reading and re-upserting the whole app_data row (two round-trips)."""
+    response = _with_retry(lambda: supabase_client.table(TABLE_NAME).select("*").eq("id", "main").execute())
+    existing_data = response.data[0]["data"] if response.data else {}
+    existing_data[STATIC_WEEK] = document
+    _with_retry(lambda: supabase_client.table(TABLE_NAME).upsert({"id": "main", "data": existing_data}).execute())
+    return document
+
+
+@st.cache_resource(show_spinner=False)
+def _update_week_status() -> Dict:
+    """Process-wide record of whether the database lacks the update_week function."""
+    return {}
+
+
+def bulk_upsert_weeks(weeks: Dict[str, Dict]) -> None:
+    """
+    Admin helper for seeding or restoring Supabase: write several weeks' data in one upsert.
+    Replaces the whole app_data row, so pass every week that should be kept. Each week is
+    normalized and stamped with SCHEMA_VERSION first (on a copy, so the caller's backup is left
+    untouched), so older layouts can be restored as-is.
+    Not used by the signup flow.
+    """
+    supabase_client = _get_client()
+    if not supabase_client:
+        raise RuntimeError("Supabase is not configured")
+    
+    rows = [{
+        "id": "main",
+        "data": {week: _serializable(_ensure_schema(copy.deepcopy(week_data))) for week, week_data in weeks.items()}
+    }]
+    _with_retry(lambda: supabase_client.table(TABLE_NAME).upsert(rows).execute())
+    load_data.clear()
+
 
+@st.cache_resource(show_spinner=False)
+def _last_file_write() -> Dict:
+    """Process-wide record of the digest and mtime of the last payload save_data() wrote."""
+    return {}
 
 
 
-def send_email(to_email: str, subject: str, body: str) -> bool:
-    """Send an email notification."""
-    if not EMAIL_CONFIG["enabled"] or not EMAIL_CONFIG["sender_email"]:
+def _lock_file(f) -> None:
+    """Acquire an exclusive lock on an open file, blocking until it is available."""
+    if fcntl:
+        fcntl.flock(f, fcntl.LOCK_EX)
+    else:
+        # LK_LOCK gives up with EDEADLOCK after ~10 seconds of retries; keep waiting like flock does
+        # (any other OSError is a real failure)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError as e:
+                if e.errno != errno.EDEADLOCK:
+                    raise
+
+
+def _unlock_file(f) -> None:
+    """Release a lock taken with _lock_file()."""
+    if fcntl:
+        fcntl.flock(f, fcntl.LOCK_UN)
+    else:
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def locked_data() -> Iterator[Dict]:
+    """
+    Load the latest data under an exclusive lock, reading the file directly rather than through
+    its cache. Callers that change it call save_data() once inside the block, so concurrent
+    signups can't overwrite each other.
+    """
+    lock_file = open(DATA_FILE + ".lock", "w")
+    _lock_file(lock_file)
+    try:
+        yield _load_data_uncached(use_file_cache=False)
+    finally:
+        _unlock_file(lock_file)
+        lock_file.close()
+
+
+def _smtp_alive(server: smtplib.SMTP) -> bool:
+    """Health-check a cached SMTP connection with NOOP before it is reused."""
+    try:
+        return server.noop()[0] == 250
+    except (smtplib.SMTPException, OSError):
+        return False
+
+
+def _close_smtp(server: smtplib.SMTP) -> None:
+    """Close an SMTP connection, ignoring errors from one that already dropped."""
+    with suppress(smtplib.SMTPException, OSError):
+        server.quit()
+
+
+@st.cache_resource(show_spinner=False)
+def smtp_lock() -> threading.RLock:
+    """Guards the shared SMTP connection so concurrent senders don't interleave commands."""
+    return threading.RLock()
+
+
+@st.cache_resource(show_spinner=False)
+def _current_smtp() -> Dict:
+    """
+    Process-wide slot holding the live SMTP connection and how many messages it has sent.
+    get_smtp() quits the previous one before reconnecting, and a single atexit handler
+    closes whatever is held at exit.
+    """
+    slot = {}
+    
+    def close_current() -> None:
+        if slot.get("server"):
+            _close_smtp(slot["server"])
+    
+    atexit.register(close_current)
+    return slot
+
+
+@st.cache_resource(show_spinner=False, validate=_smtp_alive)
+def get_smtp() -> smtplib.SMTP:
+    """Open an authenticated SMTP connection, shared across reruns and sessions."""
+    config = get_email_config()
+    # Quit the connection this replaces (dropped, failed validation or cleared) so it isn't left open
+    previous = _current_smtp().pop("server", None)
+    if previous:
+        _close_smtp(previous)
+    server = smtplib.SMTP(config["smtp_server"], config["smtp_port"])
+    server.starttls()
+    server.login(config["sender_email"], config["sender_password"])
+    _current_smtp().update(server=server, sent=0)
+    return server
+
+
+def send_email(to_email: str, subject: str, body: str, server: Optional[smtplib.SMTP] = None) -> bool:
+    """Send an email notification over the given SMTP connection, or the cached one."""
+    config = get_email_config()
+    if not config["active"]:
         return False
     
     try:
         msg = MIMEMultipart()
-        msg["From"] = EMAIL_CONFIG["sender_email"]
+        msg["From"] = config["sender_email"]
         msg["To"] = to_email
         msg["Subject"] = subject
         msg.attach(MIMEText(body, "plain"))
         
-        server = smtplib.SMTP(EMAIL_CONFIG["smtp_server"], EMAIL_CONFIG["smtp_port"])
-        server.starttls()
-        server.login(EMAIL_CONFIG["sender_email"], EMAIL_CONFIG["sender_password"])
-        server.send_message(msg)
-        server.quit()
+        with smtp_lock():
+            slot = _current_smtp()
+            if slot.get("sent", 0) >= MAX_MESSAGES_PER_CONNECTION:
+                # The shared connection has hit the per-connection limit; start a new one
+                get_smtp.clear()
+                server = None
+            try:
+                (server or get_smtp()).send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # The cached connection timed out; reconnect once and retry
+                get_smtp.clear()
+                get_smtp().send_message(msg)
+            slot["sent"] = slot.get("sent", 0) + 1
         return True
     except Exception as e:
-        st.error(f"Failed to send email: {str(e)}")
+        # Only surface the error in the UI when called from a script run; the mail worker has no page to render to
+        if get_script_run_ctx(suppress_warning=True) is not None:
+            st.error(f"Failed to send email: {str(e)}")
+        else:
+            logger.warning("Failed to send email to %s: %s", to_email, e)
         return False
 
 
-def get_xmp_category(data: Dict) -> str:
+def send_emails(messages: List[Tuple[str, str, str]]) -> int:
     """
-    Determine which category (MMP or WMP) XMP players count towards.
-    Returns "MMP" or "WMP"
+    Send several (to_email, subject, body) notifications over the shared SMTP session.
+    send_email() reconnects once the connection has sent MAX_MESSAGES_PER_CONNECTION
+    messages (counted across batches) to stay under server limits.
+    Returns the number of messages sent.
     """
-    mmp_count = len(data["signups"].get("mmp", []))
-    wmp_count = len(data["signups"].get("wmp", []))
-    
-    if mmp_count < wmp_count:
-        return "DOM this week"
-    elif wmp_count < mmp_count:
-        return "DOW this week"
-    else:
-        # If equal, count towards MMP by default
-        return "DOM this week"
+    if not get_email_config()["active"]:
+        return 0
+    
+    sent = 0
+    with smtp_lock():
+        server = get_smtp()
+        for to_email, subject, body in messages:
+            if send_email(to_email, subject, body, server=server):
+                sent += 1
+            # send_email may have reconnected; carry on with whatever connection is now shared
+            server = _current_smtp().get("server") or get_smtp()
+    return sent
+
+
+@st.cache_resource(show_spinner=False)
+def mail_executor() -> ThreadPoolExecutor:
+    """
+    Background worker that sends notification batches off the Streamlit script thread,
+    so the UI updates without waiting on SMTP.
+    """
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="mail")
+
+
+def _log_mail_failure(future: Future) -> None:
+    """Log a batch that failed outright (e.g. SMTP connect); the triggering rerun is long gone."""
+    if future.exception() is not None:
+        logger.error("Failed to send queued email batch: %s", future.exception())
 
 
-def get_effective_counts(data: Dict) -> Tuple[int, int]:
+def queue_emails(messages: List[Tuple[str, str, str]]) -> None:
+    """Send a batch of (to_email, subject, body) notifications in the background."""
+    mail_executor().submit(send_emails, messages).add_done_callback(_log_mail_failure)
+
+
+def compute_week_state(data: Dict) -> Tuple[int, int, int, int, int, str]:
     """
-    Calculate effective counts for MMP and WMP, accounting for XMP players.
-    XMP players count towards whichever category has fewer players.
-    Returns (effective_mmp_count, effective_wmp_count)
+    Calculate signup counts for the week in a single pass, accounting for XMP players.
+    XMP players count towards whichever category has fewer players (MMP if equal).
+    Returns (mmp_count, wmp_count, no_pref_count, effective_mmp, effective_wmp, xmp_category)
     """
-    mmp_count = len(data["signups"].get("mmp", []))
-    wmp_count = len(data["signups"].get("wmp", []))
-    no_pref_count = len(data["signups"].get("no_preference", []))
+    signups = data["signups"]
+    mmp_count = len(signups["mmp"])
+    wmp_count = len(signups["wmp"])
+    no_pref_count = len(signups["no_preference"])
     
-    # Distribute no_preference players to the category with fewer players
-    if mmp_count < wmp_count:
-        effective_mmp = mmp_count + no_pref_count
-        effective_wmp = wmp_count
-    elif wmp_count < mmp_count:
-        effective_mmp = mmp_count
-        effective_wmp = wmp_count + no_pref_count
-    else:
-        # If equal, distribute to MMP by default
-        effective_mmp = mmp_count + no_pref_count
-        effective_wmp = wmp_count
-    
-    return (effective_mmp, effective_wmp)
+    if wmp_count < mmp_count:
+        return mmp_count, wmp_count, no_pref_count, mmp_count, wmp_count + no_pref_count, "DOW this week"
+    # MMP has fewer players, or counts are equal and MMP is the default
+    return mmp_count, wmp_count, no_pref_count, mmp_count + no_pref_count, wmp_count, "DOM this week"
+
+
+def update_player_info(data: Dict, player_id: str, name: str, email: str) -> bool:
+    """
+    Store player info if not exists or update name/email.
+    Returns True if the stored record changed.
+    """
+    existing = data["players"].get(player_id)
+    if not existing:
+        data["players"][player_id] = {
+            "name": name,
+            "email": email,
+            "type": None
+        }
+        return True
+    if existing.get("email") == email and existing.get("name") == name:
+        return False
+    existing["email"] = email
+    existing["name"] = name
+    return True
 
 
-def signup_player(data: Dict, player_id: str, player_type: str) -> Tuple[bool, Optional[str]]:
+def signup_player(data: Dict, player_id: str, player_type: str) -> Tuple[bool, Optional[str], bool]:
     """
-    Sign up a player.
-    Returns (success, message)
+    Sign up a player. Mutates data in place; the caller saves it when dirty (see locked_data()).
+    Returns (success, message, dirty)
     """
     signups = data["signups"][player_type]
+    signup_idx = data["_signup_idx"][player_type]
     waitlist = data["waitlists"][player_type]
+    waitlist_idx = data["_waitlist_idx"][player_type]
     
     # Check if already signed up
-    if player_id in signups:
-        return False, "You are already signed up!"
+    if player_id in signup_idx:
+        return False, "You are already signed up!", False
     
     # Check if already on waitlist
-    if player_id in waitlist:
-        return False, "You are already on the waitlist!"
+    if player_id in waitlist_idx:
+        return False, "You are already on the waitlist!", False
     
     # For XMP (no_preference) players, check against the category with fewer players
     if player_type == "no_preference":
-        mmp_count = len(data["signups"]["mmp"])
-        wmp_count = len(data["signups"]["wmp"])
-        no_pref_count = len(data["signups"]["no_preference"])
-
+        mmp_count, wmp_count, no_pref_count, _, _, _ = compute_week_state(data)
         
-        # Determine which category to count towards (before adding this player)
-        if mmp_count < wmp_count:
-            # Count towards MMP limit
-            # Effective MMP count after adding would be: mmp_count + no_pref_count + 1
-            if mmp_count + no_pref_count + 1 <= MAX_PLAYERS_PER_TYPE:
-                signups.append(player_id)
-                save_data(data)
-                return True, "Successfully signed up!"
-            else:
-                waitlist.append(player_id)
-                save_data(data)
-                position = len(waitlist)
-                return True, f"Added to waitlist (position {position})."
-        elif wmp_count < mmp_count:
-            # Count towards WMP limit
-            # Effective WMP count after adding would be: wmp_count + no_pref_count + 1
-            if wmp_count + no_pref_count + 1 <= MAX_PLAYERS_PER_TYPE:
-                signups.append(player_id)
-                save_data(data)
-                return True, "Successfully signed up!"
-            else:
-                waitlist.append(player_id)
-                save_data(data)
-                position = len(waitlist)
-                return True, f"Added to waitlist (position {position})."
+        # XMP players count towards whichever category has fewer players (MMP on ties),
+        # so the limiting count is the smaller of the two
+        limiting_count = min(mmp_count, wmp_count)
+        if limiting_count + no_pref_count + 1 <= MAX_PLAYERS_PER_TYPE:
+            signups.append(player_id)
+            signup_idx.add(player_id)
+            return True, "Successfully signed up!", True
         else:
-            # Equal counts, count towards MMP by default
-            # Effective MMP count after adding would be: mmp_count + no_pref_count + 1
-            if mmp_count + no_pref_count + 1 <= MAX_PLAYERS_PER_TYPE:
-                signups.append(player_id)
-                save_data(data)
-                return True, "Successfully signed up!"
-            else:
-                waitlist.append(player_id)
-                save_data(data)
-                position = len(waitlist)
-                return True, f"Added to waitlist (position {position})."
+            waitlist.append(player_id)
+            waitlist_idx[player_id] = len(waitlist)
+            position = len(waitlist)
+            return True, f"Added to waitlist (position {position}).", True
     else:
         # For MMP and WMP, use standard logic
         if len(signups) < MAX_PLAYERS_PER_TYPE:
             signups.append(player_id)
-            save_data(data)
-            return True, "Successfully signed up!"
+            signup_idx.add(player_id)
+            return True, "Successfully signed up!", True
         else:
             # Add to waitlist
             waitlist.append(player_id)
-            save_data(data)
+            waitlist_idx[player_id] = len(waitlist)
             position = len(waitlist)
-            return True, f"Added to waitlist (position {position})."
+            return True, f"Added to waitlist (position {position}).", True
 
 
-def remove_player(data: Dict, player_id: str, player_type: str) -> Tuple[bool, Optional[str]]:
+def remove_player(data: Dict, player_id: str, player_type: str) -> Tuple[bool, Optional[str], bool]:
     """
     Remove a player from signup and promote from waitlist if needed.
-    Returns (success, message)
+    Mutates data in place; the caller saves it when dirty (see locked_data()).
+    Returns (success, message, dirty)
+    """
+    notifications = []
+    result = _remove_player(data, player_id, player_type, notifications)
+    if notifications:
+        queue_emails(notifications)
+    return result
+
+
+def remove_players_bulk(data: Dict, removals: List[Tuple[str, str]]) -> List[Tuple[bool, Optional[str], bool]]:
+    """
+    Remove several (player_id, player_type) entries, promoting from waitlists as needed.
+    All promotion emails are queued as one batch so they share a single SMTP session.
+    Mutates data in place; the caller saves it once if any result is dirty (see locked_data()).
+    Returns a (success, message, dirty) result per removal.
+    """
+    notifications = []
+    results = [_remove_player(data, player_id, player_type, notifications) for player_id, player_type in removals]
+    if notifications:
+        queue_emails(notifications)
+    return results
+
+
+def _remove_player(data: Dict, player_id: str, player_type: str,
+                   notifications: List[Tuple[str, str, str]]) -> Tuple[bool, Optional[str], bool]:
+    """
+    Remove a single player, appending any promotion email to notifications instead of sending it.
+    Returns (success, message, dirty)
     """
     signups = data["signups"][player_type]
+    signup_idx = data["_signup_idx"][player_type]
     waitlist = data["waitlists"][player_type]
+    waitlist_idx = data["_waitlist_idx"][player_type]
     
     # Check if player is signed up
-    if player_id in signups:
+    if player_id in signup_idx:
         signups.remove(player_id)
+        signup_idx.discard(player_id)
         
         # Promote from waitlist if available
         if waitlist:
-            promoted_id = waitlist.pop(0)
+            promoted_id = waitlist.popleft()
+            data["_waitlist_idx"][player_type] = _index_waitlist(waitlist)
             signups.append(promoted_id)
+            signup_idx.add(promoted_id)
             
-            # Send email notification to promoted player
+            # Queue email notification to promoted player
             if promoted_id in data["players"]:
                 promoted_player = data["players"][promoted_id]
                 email = promoted_player.get("email", "")
                 if email:
-                    subject = f"Winter Hoopla - You have a spot for {STATIC_DATE} {STATIC_TIME}"
-                    body = f"Hi {promoted_player['name']},\n\n"
-                    body += f"This is an automated email. You've been promoted from the waitlist and are now signed up "
-                    body += f"to attend indoor goaltimate at ComEd Rec Center.\n\n"
-                    body += f"Session Details:\n"
-                    body += f"Date/Time: {STATIC_DATE}, {STATIC_TIME}\n"
-                    body += f"Location: ComEd Rec Center\n\n"
-                    body += f"If you can no longer attend, please remove your signup so that the next player on the waitlist can be promoted.\n"
-                    body += f"You can manage your signup at: https://winter-hoopla.streamlit.app/\n\n"
-                    body += "See you on the field!\n\n"
-                    body += "- Annie"
-                    send_email(email, subject, body)
+                    body = PROMOTION_BODY.format(name=promoted_player["name"])
+                    notifications.append((email, PROMOTION_SUBJECT, body))
             
-            save_data(data)
-            return True, "Removed from signup. Top waitlist player has been promoted and notified."
+            return True, "Removed from signup. Top waitlist player has been promoted and notified.", True
         else:
-            save_data(data)
-            return True, "Successfully removed from signup."
+            return True, "Successfully removed from signup.", True
     
     # Check if player is on waitlist
-    elif player_id in waitlist:
+    elif player_id in waitlist_idx:
         waitlist.remove(player_id)
-        save_data(data)
-        return True, "Removed from waitlist."
+        data["_waitlist_idx"][player_type] = _index_waitlist(waitlist)
+        return True, "Removed from waitlist.", True
     else:
-        return False, "You are not signed up."
+        return False, "You are not signed up.", False
+
+
+def render_category(label: str, count_display: str, signed_up, waitlisted,
+                    name_of: Dict[str, str], suffix: str = "") -> None:
+    """Render one category column: heading, signup list, and waitlist."""
+    st.subheader(f"{label} ({count_display})")
+    # Render each list as a single markdown element rather than one element per row
+    if signed_up:
+        st.markdown("\n".join(f"{idx}. {name_of.get(pid, pid)}{suffix}" for idx, pid in enumerate(signed_up, 1)))
+    else:
+        st.info(f"No {label} players")
+    
+    # Show waitlist
+    if waitlisted:
+        st.markdown(f"**{label} Waitlist:**")
+        st.markdown("\n".join(f"{idx}. {name_of.get(pid, pid)}{suffix}" for idx, pid in enumerate(waitlisted, 1)))
+
+
+def _session_data(data_version: Optional[float]) -> Dict:
+    """
+    Return this session's copy of the data so keystroke reruns don't reload it.
+    Reloads on Refresh, when the data file changed, or after DATA_CACHE_TTL_SECONDS
+    so other users' signups still show up. Saves store their result via _remember_data.
+    """
+    cached = st.session_state.get("data")
+    if cached is None or cached[1] != data_version or time.monotonic() - cached[0] > DATA_CACHE_TTL_SECONDS:
+        data = load_data(data_version)
+        return _remember_data(data, data_version, loaded_at=data["_loaded_at"])
+    return cached[2]
+
+
+def _remember_data(data: Dict, data_version: Optional[float], loaded_at: Optional[float] = None) -> Dict:
+    """Keep data in this session so the next rerun can reuse it without reloading."""
+    st.session_state["data"] = (time.monotonic() if loaded_at is None else loaded_at, data_version, data)
+    return data
+
+
+def _refresh_data():
+    """Drop cached data so the next rerun fetches the latest signups."""
+    load_data.clear()
+    st.session_state.pop("data", None)
 
 
 def main():
@@ -393,10 +812,13 @@ def main():
     st.title("Winter Hoopla - Session 1 (Mixed)")
     
     # Load data
-    data = load_data()
+    data_version = _data_version()
+    data = _session_data(data_version)
+    signups, waitlists = data["signups"], data["waitlists"]
+    signup_idx, waitlist_idx = data["_signup_idx"], data["_waitlist_idx"]
     
     # Display static date and location
-    st.subheader(f"Week {WEEK_NUMBER}: **{STATIC_DATE}, {STATIC_TIME} at ComEd Rec Center**")
+    st.subheader(f"Week {WEEK_NUMBER}: **{SESSION_DISPLAY} at ComEd Rec Center**")
     st.write("- 7-7:15pm: Drills or small-sided reps")
     st.write("- 7:15-8:29pm: Scrimmage")
     st.write("- 8:29-8:30pm: Clean up :)")
@@ -406,70 +828,37 @@ def main():
     
     # Show signups - no authentication required
     st.subheader("Current Signups and Waitlist")
+    st.button("Refresh", key="refresh_btn", on_click=_refresh_data)
     st.write(":red[Please do not sign up unless you plan to attend. If you need to cancel, please remove your signup ASAP to allow others to join.]")
     st.write("**:red[Please do not wait until Tuesday to cancel your signup if possible.]**")
     st.write("If there are fewer than 6 WMP signed up for a given week, I will take MMP off the waitlist and we will run a game with no prescribed ratio. If this occurs I will notify players that are being moved up from the waitlist around noon the day of.")
     
+    # Display names for everyone listed below; the players dict also keeps players who have since left
+    players = data["players"]
+    name_of = {
+        pid: players[pid].get("name", pid)
+        for ids in (*signups.values(), *waitlists.values())
+        for pid in ids
+        if pid in players
+    }
+    
     # Calculate effective counts for display
-    effective_mmp, effective_wmp = get_effective_counts(data)
-    no_pref_count = len(data["signups"].get("no_preference", []))
+    _, _, no_pref_count, effective_mmp, effective_wmp, xmp_category = compute_week_state(data)
 
     st.write(":blue[Annie, Graham, and Tuc are attending this week but we are not including ourselves in the counts below.]")
-    col1, col2, col3 = st.columns(3)
+    columns = st.columns(3)
     st.write("XMP (players with no gender matching preference) will count towards whichever category has fewer players.")
     
-
-    with col1:
-        st.subheader(f"MMP ({effective_mmp}/{MAX_PLAYERS_PER_TYPE})")
-        if data["signups"]["mmp"]:
-            for idx, pid in enumerate(data["signups"]["mmp"], 1):
-                player_name_display = data["players"].get(pid, {}).get("name", pid)
-                st.write(f"{idx}. {player_name_display}")
-        else:
-            st.info("No MMP players")
-        
-        # Show waitlist
-        if data["waitlists"].get("mmp"):
-            st.markdown("**MMP Waitlist:**")
-            for idx, pid in enumerate(data["waitlists"]["mmp"], 1):
-                player_name_display = data["players"].get(pid, {}).get("name", pid)
-                st.write(f"  {idx}. {player_name_display}")
-    
-    with col2:
-        st.subheader(f"WMP ({effective_wmp}/{MAX_PLAYERS_PER_TYPE})")
-        if data["signups"]["wmp"]:
-            for idx, pid in enumerate(data["signups"]["wmp"], 1):
-                player_name_display = data["players"].get(pid, {}).get("name", pid)
-                st.write(f"{idx}. {player_name_display}")
-        else:
-            st.info("No WMP players")
-        
-        # Show waitlist
-        if data["waitlists"].get("wmp"):
-            st.markdown("**WMP Waitlist:**")
-            for idx, pid in enumerate(data["waitlists"]["wmp"], 1):
-                player_name_display = data["players"].get(pid, {}).get("name", pid)
-                st.write(f"  {idx}. {player_name_display}")
-    
-    with col3:
-        st.subheader(f"XMP ({no_pref_count})")
-        if data["signups"].get("no_preference"):
-            # Determine which category XMP players count towards
-            xmp_category = get_xmp_category(data)
-            for idx, pid in enumerate(data["signups"]["no_preference"], 1):
-                player_name_display = data["players"].get(pid, {}).get("name", pid)
-                st.write(f"{idx}. {player_name_display} ({xmp_category})")
-        else:
-            st.info("No XMP players")
-        
-        # Show waitlist
-        if data["waitlists"].get("no_preference"):
-            st.markdown("**XMP Waitlist:**")
-            # For waitlist, determine category based on current signups
-            xmp_category = get_xmp_category(data)
-            for idx, pid in enumerate(data["waitlists"]["no_preference"], 1):
-                player_name_display = data["players"].get(pid, {}).get("name", pid)
-                st.write(f"  {idx}. {player_name_display} ({xmp_category})")
+    # (key, label, count shown in the heading, suffix shown after each name)
+    xmp_suffix = f" ({xmp_category})"
+    sections = [
+        ("mmp", "MMP", f"{effective_mmp}/{MAX_PLAYERS_PER_TYPE}", ""),
+        ("wmp", "WMP", f"{effective_wmp}/{MAX_PLAYERS_PER_TYPE}", ""),
+        ("no_preference", "XMP", f"{no_pref_count}", xmp_suffix),
+    ]
+    for col, (key, label, count_display, suffix) in zip(columns, sections):
+        with col:
+            render_category(label, count_display, signups[key], waitlists[key], name_of, suffix)
     
     st.markdown("---")
     
@@ -492,21 +881,13 @@ def main():
     
     if player_name and player_email:
         # Basic email validation
-        if "@" in player_email and "." in player_email.split("@")[1]:
-            # Create or get player ID
-            player_id = player_name.lower().strip().replace(" ", "_")
-            
-            # Store player info if not exists or update email
-            if player_id not in data["players"]:
-                data["players"][player_id] = {
-                    "name": player_name,
-                    "email": player_email,
-                    "type": None
-                }
-            else:
-                data["players"][player_id]["email"] = player_email
-                data["players"][player_id]["name"] = player_name
-            save_data(data)
+        if EMAIL_PATTERN.match(player_email):
+            # Create or get player ID (memoized on the raw name so reruns reuse it)
+            cached_pid = st.session_state.get("_pid_cache")
+            if not cached_pid or cached_pid[0] != player_name:
+                cached_pid = (player_name, player_name.lower().strip().replace(" ", "_"))
+                st.session_state["_pid_cache"] = cached_pid
+            player_id = cached_pid[1]
             
             can_interact = True
         else:
@@ -516,32 +897,40 @@ def main():
     
     if can_interact:
         
-        # Check if player is signed up or on waitlist
-        is_signed_up = False
-        is_on_waitlist = False
-        player_type_current = None
-        
-        if player_id in data["signups"].get("mmp", []):
-            is_signed_up = True
-            player_type_current = "mmp"
-        elif player_id in data["signups"].get("wmp", []):
-            is_signed_up = True
-            player_type_current = "wmp"
-        elif player_id in data["signups"].get("no_preference", []):
-            is_signed_up = True
-            player_type_current = "no_preference"
+        # Check if player is signed up or on waitlist, reusing the previous rerun's answer
+        # while the player and the data version are unchanged
+        lookup_key = (player_id, data_version)
+        cached_lookup = st.session_state.get("_lookup_cache")
+        if data_version is not None and cached_lookup and cached_lookup[0] == lookup_key:
+            is_signed_up, is_on_waitlist, player_type_current = cached_lookup[1]
+        else:
+            is_signed_up = False
+            is_on_waitlist = False
+            player_type_current = None
         
-        if not is_signed_up:
-            if player_id in data["waitlists"].get("mmp", []):
-                is_on_waitlist = True
+            if player_id in signup_idx["mmp"]:
+                is_signed_up = True
                 player_type_current = "mmp"
-            elif player_id in data["waitlists"].get("wmp", []):
-                is_on_waitlist = True
+            elif player_id in signup_idx["wmp"]:
+                is_signed_up = True
                 player_type_current = "wmp"
-            elif player_id in data["waitlists"].get("no_preference", []):
-                is_on_waitlist = True
+            elif player_id in signup_idx["no_preference"]:
+                is_signed_up = True
                 player_type_current = "no_preference"
         
+            if not is_signed_up:
+                if player_id in waitlist_idx["mmp"]:
+                    is_on_waitlist = True
+                    player_type_current = "mmp"
+                elif player_id in waitlist_idx["wmp"]:
+                    is_on_waitlist = True
+                    player_type_current = "wmp"
+                elif player_id in waitlist_idx["no_preference"]:
+                    is_on_waitlist = True
+                    player_type_current = "no_preference"
+            
+            st.session_state["_lookup_cache"] = (lookup_key, (is_signed_up, is_on_waitlist, player_type_current))
+        
         # Consolidated Sign Up / Remove Signup section
         if is_signed_up or is_on_waitlist:
             # Show Remove Signup option
@@ -550,11 +939,15 @@ def main():
             if is_signed_up:
                 st.warning(f"✅ You are signed up as **{type_display}**")
             elif is_on_waitlist:
-                position = data["waitlists"][player_type_current].index(player_id) + 1
+                position = waitlist_idx[player_type_current][player_id]
                 st.info(f"⏳ You are on the waitlist (position {position}) as **{type_display}**")
             
             if st.button("Remove Signup", type="primary", key="remove_btn"):
-                success, message = remove_player(data, player_id, player_type_current)
+                with locked_data() as fresh_data:
+                    player_changed = update_player_info(fresh_data, player_id, player_name, player_email)
+                    success, message, dirty = remove_player(fresh_data, player_id, player_type_current)
+                    if dirty or player_changed:
+                        _remember_data(save_data(fresh_data), _data_version())
                 if success:
                     st.success(message)
                 else:
@@ -576,7 +969,11 @@ def main():
                 player_type_internal = "no_preference" if player_type == "XMP" else player_type.lower()
                 
                 if st.button("Sign Up", type="primary", key="signup_btn"):
-                    success, message = signup_player(data, player_id, player_type_internal)
+                    with locked_data() as fresh_data:
+                        player_changed = update_player_info(fresh_data, player_id, player_name, player_email)
+                        success, message, dirty = signup_player(fresh_data, player_id, player_type_internal)
+                        if dirty or player_changed:
+                            _remember_data(save_data(fresh_data), _data_version())
                     if success:
                         st.success(message)
                     else:
@@ -586,7 +983,7 @@ def main():
     # Footer with email configuration status
     st.markdown("---")
     st.write("If you have any feedback or questions, please email Annie: winterhoopla@gmail.com")
-    if EMAIL_CONFIG["enabled"]:
+    if get_email_config()["enabled"]:
         st.caption("Email notifications enabled. You will receive an email if you are moved up from the waitlist.")
     else:
         st.caption("ℹ️ Email notifications disabled. Configure email settings to enable waitlist notifications.")